@@ -5,7 +5,7 @@ from dotenv import load_dotenv
 from openai import OpenAI
 from anthropic import Anthropic
 
-from llm_cli.constants import MODEL_MAPPINGS
+from llm_cli.constants import MODEL_MAPPINGS, OPENAI_MODELS
 from llm_cli.utils import read_system_message_from_file, get_prompts
 
 
@@ -78,20 +78,19 @@ class ChatInterface:
         prompt_str = read_system_message_from_file(file_name)
         messages = [{"role": "system", "content": prompt_str}]
 
-        # Add conversation history
-        if history:
-            for user_msg, assistant_msg in history[:-1]:
-                messages.extend([
-                    {"role": "user", "content": user_msg},
-                    {"role": "assistant", "content": assistant_msg}
-                ])
+        # Add conversation history in a single pass
+        messages += [
+            {"role": role, "content": content}
+            for user_msg, assistant_msg in history[:-1]
+            for role, content in (("user", user_msg), ("assistant", assistant_msg))
+        ]
 
         # Add current user message
         user_input = history[-1][0]
         messages.append({"role": "user", "content": user_input})
 
         # Get response stream based on model choice
-        if model_choice in ["gpt-4o", "gpt-4-turbo"]:
+        if model_choice in OPENAI_MODELS:
             response_stream = self.llm_client.stream_openai_response(
                 messages, model_choice
             )
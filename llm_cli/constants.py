@@ -3,3 +3,6 @@ MODEL_MAPPINGS = {
     "gpt-4-turbo": "gpt-4-turbo",
     "sonnet": "claude-3-5-sonnet-latest"
 }
+
+# Models served through the OpenAI client; everything else goes to Anthropic
+OPENAI_MODELS = frozenset({"gpt-4o", "gpt-4-turbo"})
@@ -3,7 +3,8 @@ import pathlib
 import argparse
 import os
 import sys
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 from platformdirs import user_data_dir, user_config_dir
 
@@ -109,8 +110,9 @@ class ChatConverter:
             sys.exit(1)
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse and validate command line arguments."""
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser, constructing it only once."""
     parser = argparse.ArgumentParser(
         description='Convert chat JSON logs to Markdown format')
     parser.add_argument(
@@ -134,7 +136,12 @@ def parse_args() -> argparse.Namespace:
         action='store_true',
         help='List all available chat files'
     )
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse and validate command line arguments, defaulting to sys.argv."""
+    return build_parser().parse_args(argv)
 
 
 def main() -> None:
@@ -156,9 +163,7 @@ def main() -> None:
 
     # Check if json_file is provided when not listing
     if not args.json_file:
-        parser = argparse.ArgumentParser(
-            description='Convert chat JSON logs to Markdown format')
-        parser.error("json_file is required when not using --list")
+        build_parser().error("json_file is required when not using --list")
 
     # Handle file paths
     json_path = (config.chat_dir / args.json_file
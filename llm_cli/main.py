@@ -8,11 +8,9 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 from platformdirs import user_data_dir
 
 from dotenv import load_dotenv
-from openai import OpenAI
-from anthropic import Anthropic
 from colored import fg, attr
 
-from llm_cli.constants import MODEL_MAPPINGS
+from llm_cli.constants import MODEL_MAPPINGS, OPENAI_MODELS
 from llm_cli.utils import read_system_message_from_file
 
 
@@ -23,6 +21,18 @@ AI_COLOR = fg("blue") + attr("bold")
 SYSTEM_COLOR = fg("violet") + attr("bold")
 RESET_COLOR = attr("reset")
 
+# Prefixes used when replaying chat history
+USER_PREFIX = f"{USER_COLOR}Human: {RESET_COLOR}"
+AI_PREFIX = f"{AI_COLOR}AI: {RESET_COLOR}"
+
+# Input prompts and commands, built once rather than per input call
+USER_PROMPT = f"{USER_COLOR}Human:{RESET_COLOR} "
+MULTILINE_NOTICE = (
+    f'{USER_COLOR}Enter multi-line input'
+    f' (end with a line containing only ">>"):{RESET_COLOR}'
+)
+VALID_COMMANDS = frozenset({"save", "load", "append"})
+
 
 @dataclass
 class Config:
@@ -53,9 +63,17 @@ class ChatHistory:
     def save(self, filename: str) -> None:
         """Save chat history to a file."""
         filepath = Path(self.config.chat_dir) / filename
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, "w") as f:
-            json.dump(self.messages, f, indent=2)
+        # Serialize before opening so a failure can't truncate an existing
+        # file, and so the file is written in one call
+        data = json.dumps(self.messages, indent=2)
+        try:
+            with open(filepath, "w") as f:
+                f.write(data)
+        except FileNotFoundError:
+            # Only create the directory when it's actually missing
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with open(filepath, "w") as f:
+                f.write(data)
 
     def load(self, filename: str) -> None:
         """Load chat history from a file."""
@@ -94,13 +112,16 @@ class ChatHistory:
             if msg["role"] == "system":
                 continue
 
-            role_label = "Human" if msg["role"] == "user" else "AI"
-            role_color = USER_COLOR if msg["role"] == "user" else AI_COLOR
-            print(f"{role_color}{role_label}: {RESET_COLOR}{msg['content']}")
+            prefix = USER_PREFIX if msg["role"] == "user" else AI_PREFIX
+            print(f"{prefix}{msg['content']}")
 
 
 class LLMClient:
     def __init__(self, config: Config):
+        # The SDKs are slow to import, so defer them until a client is needed
+        from openai import OpenAI
+        from anthropic import Anthropic
+
         self.config = config
         self.openai = OpenAI()
         self.anthropic = Anthropic()
@@ -117,13 +138,13 @@ class LLMClient:
             model=model, messages=messages, stream=True
         )
 
-        response_str = ""
+        response_parts = []
         for chunk in completion:
             message_content = chunk.choices[0].delta.content
             if message_content:
                 print(message_content, end="", flush=True)
-                response_str += message_content
-        return response_str
+                response_parts.append(message_content)
+        return "".join(response_parts)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -139,24 +160,21 @@ class LLMClient:
             system=messages[0]["content"],
             max_tokens=1024,
         ) as stream:
-            response_str = ""
+            response_parts = []
             for text in stream.text_stream:
                 print(text, end="", flush=True)
-                response_str += text
-            return response_str
+                response_parts.append(text)
+            return "".join(response_parts)
 
 
 class InputHandler:
     @staticmethod
     def get_user_input() -> str:
         """Get single or multi-line input from user."""
-        first_line = input(f"{USER_COLOR}Human:{RESET_COLOR} ").strip()
+        first_line = input(USER_PROMPT).strip()
 
         if first_line.startswith(">"):
-            print(
-                f'{USER_COLOR}Enter multi-line input'
-                f' (end with a line containing only ">>"):{RESET_COLOR}'
-            )
+            print(MULTILINE_NOTICE)
             lines = []
             while True:
                 line = input()
@@ -176,14 +194,14 @@ class InputHandler:
         command = parts[0][1:]  # Remove the % prefix
         args = parts[1] if len(parts) > 1 else None
 
-        valid_commands = {"save", "load", "append"}
-        if command not in valid_commands:
+        if command not in VALID_COMMANDS:
             raise ValueError(f"Unknown command: {command}")
 
         return command, args
 
 
-def main():
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments, defaulting to sys.argv."""
     parser = argparse.ArgumentParser(
         description="Run an interactive LLM chat session."
     )
@@ -207,7 +225,11 @@ def main():
         help="Load a chat history file at startup",
     )
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_arguments()
 
     config = Config()
     chat_history = ChatHistory(config)
@@ -272,7 +294,7 @@ def main():
             finished = False
             print(f"{AI_COLOR}AI:{RESET_COLOR}", end=" ", flush=True)
 
-            if args.model in ["gpt-4o", "gpt-4-turbo"]:
+            if args.model in OPENAI_MODELS:
                 response = llm_client.get_openai_response(
                     chat_history.messages,
                     config.models[args.model]
@@ -1,17 +1,46 @@
-import re
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 from platformdirs import user_config_dir
 from importlib import resources
 
 
+_PROMPT_PREFIX = "prompt_"
+_PROMPT_SUFFIX = ".txt"
+
+
+@lru_cache(maxsize=None)
+def _get_user_prompts_dir() -> Path:
+    """Return the user prompts directory, creating it on first use."""
+    config_dir = Path(user_config_dir("llm_cli", ensure_exists=True)) / "prompts"
+    config_dir.mkdir(exist_ok=True)
+    return config_dir
+
+
+def _get_mtime(path: Path) -> Optional[int]:
+    """Return the modification time of path, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def read_system_message_from_file(file_name: str) -> str:
     """Read system message from a prompt file, checking user config first then package."""
+    user_prompt = _get_user_prompts_dir() / file_name
+    # Keying on the user file's mtime picks up edits and new overrides
+    return _read_system_message(file_name, _get_mtime(user_prompt))
+
+
+@lru_cache(maxsize=32)
+def _read_system_message(file_name: str, user_mtime: Optional[int]) -> str:
+    """Read a prompt file; cached per user override mtime (None if absent)."""
     # First try user config directory
-    config_dir = Path(user_config_dir("llm_cli", ensure_exists=True)) / "prompts"
-    config_dir.mkdir(exist_ok=True)
+    config_dir = _get_user_prompts_dir()
     user_prompt = config_dir / file_name
 
-    if user_prompt.exists():
+    if user_mtime is not None:
         with open(user_prompt, "r") as file:
             return file.read()
 
@@ -26,26 +55,46 @@ def read_system_message_from_file(file_name: str) -> str:
         )
 
 
+def _prompt_name(file_name: str) -> Optional[str]:
+    """Return the prompt name for a prompt_<name>.txt file, else None."""
+    if (
+        len(file_name) > len(_PROMPT_PREFIX) + len(_PROMPT_SUFFIX)
+        and file_name.startswith(_PROMPT_PREFIX)
+        and file_name.endswith(_PROMPT_SUFFIX)
+    ):
+        return file_name[len(_PROMPT_PREFIX):-len(_PROMPT_SUFFIX)]
+    return None
+
+
 def get_prompts() -> list[str]:
     """Get available prompts from both user config and package directories."""
-    prompts = set()  # Use set to avoid duplicates
-    pattern = r'prompt_(.+)\.txt'
+    # The directory mtime changes whenever prompt files are added or removed
+    return list(_get_prompts(_get_mtime(_get_user_prompts_dir())))
+
+
+@lru_cache(maxsize=4)
+def _get_prompts(user_dir_mtime: Optional[int]) -> tuple[str, ...]:
+    """List prompt names; cached per user prompts directory mtime."""
+    prompts: dict[str, None] = {}  # Dict keys avoid duplicates
 
     # Check user config directory
-    config_dir = Path(user_config_dir("llm_cli", ensure_exists=True)) / "prompts"
-    config_dir.mkdir(exist_ok=True)
+    config_dir = _get_user_prompts_dir()
 
-    # Add prompts from user config
-    for file in config_dir.glob("prompt_*.txt"):
-        if match := re.match(pattern, file.name):
-            prompts.add(match.group(1))
+    # Add prompts from user config (scandir yields names without extra stats)
+    try:
+        with os.scandir(config_dir) as entries:
+            for entry in entries:
+                if name := _prompt_name(entry.name):
+                    prompts[name] = None
+    except FileNotFoundError:
+        pass  # Directory was removed after startup
 
-    # Add prompts from package
+    # Add prompts from package (may be a zip, so keep the Traversable API)
     try:
         for file in resources.files('llm_cli.prompts').iterdir():
-            if match := re.match(pattern, file.name):
-                prompts.add(match.group(1))
+            if name := _prompt_name(file.name):
+                prompts[name] = None
     except (TypeError, ModuleNotFoundError):
         pass  # Handle case where package prompts directory doesn't exist
 
-    return sorted(list(prompts))  # Return sorted list for consistent ordering
+    return tuple(sorted(prompts))  # Return sorted tuple for consistent ordering
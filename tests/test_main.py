@@ -1,11 +1,29 @@
 import pytest
-from unittest.mock import patch, mock_open
+from unittest.mock import Mock, patch, mock_open
 import json
+from dataclasses import asdict
 
-from llm_cli.main import Config, ChatHistory, LLMClient, InputHandler
+from llm_cli.main import (
+    Config, ChatHistory, LLMClient, InputHandler, parse_arguments
+)
 from llm_cli.constants import MODEL_MAPPINGS
 
 
+# Test data, shared across tests and serialized once for mock_open
+TEST_MESSAGES = [
+    {"role": "system", "content": "test system"},
+    {"role": "user", "content": "test user"}
+]
+TEST_MESSAGES_JSON = json.dumps(TEST_MESSAGES)
+
+APPENDED_MESSAGES = [
+    {"role": "system", "content": "system2"},
+    {"role": "user", "content": "user2"},
+    {"role": "assistant", "content": "assistant2"}
+]
+APPENDED_MESSAGES_JSON = json.dumps(APPENDED_MESSAGES)
+
+
 # Fixtures
 @pytest.fixture
 def config():
@@ -25,21 +43,40 @@ def chat_history(config):
     return ChatHistory(config)
 
 
-@pytest.fixture
-def llm_client(config):
-    return LLMClient(config)
+@pytest.fixture(scope="module")
+def input_handler():
+    # InputHandler holds no state, so one instance serves every test
+    return InputHandler()
 
 
 # Test Config
 def test_config_defaults():
-    config = Config()
-    assert isinstance(config.chat_dir, str)
-    assert isinstance(config.temp_file, str)
-    assert config.models == MODEL_MAPPINGS
-    assert config.max_history_pairs == 3
-    assert config.retry_attempts == 3
-    assert config.min_retry_wait == 4
-    assert config.max_retry_wait == 10
+    config = asdict(Config())
+    # Paths depend on the environment, so only check their types
+    assert isinstance(config.pop("chat_dir"), str)
+    assert isinstance(config.pop("temp_file"), str)
+    assert config == {
+        "models": MODEL_MAPPINGS,
+        "max_history_pairs": 3,
+        "retry_attempts": 3,
+        "min_retry_wait": 4,
+        "max_retry_wait": 10,
+    }
+
+
+# Test argument parsing
+def test_parse_arguments_defaults():
+    args = parse_arguments([])
+    assert args.prompt == "general"
+    assert args.model == "gpt-4o"
+    assert args.load is None
+
+
+def test_parse_arguments_explicit():
+    args = parse_arguments(["concise", "-m", "sonnet", "-l", "chat.json"])
+    assert args.prompt == "concise"
+    assert args.model == "sonnet"
+    assert args.load == "chat.json"
 
 
 # Test ChatHistory
@@ -50,10 +87,7 @@ def test_chat_history_init(chat_history):
 def test_chat_history_save(chat_history, tmp_path):
     # Setup
     chat_history.config.chat_dir = str(tmp_path)
-    chat_history.messages = [
-        {"role": "system", "content": "test system"},
-        {"role": "user", "content": "test user"}
-    ]
+    chat_history.messages = TEST_MESSAGES.copy()
 
     # Execute
     chat_history.save("test.json")
@@ -66,20 +100,41 @@ def test_chat_history_save(chat_history, tmp_path):
     assert saved_data == chat_history.messages
 
 
+def test_chat_history_save_creates_missing_dir(chat_history, tmp_path):
+    chat_history.config.chat_dir = str(tmp_path / "missing" / "chats")
+    chat_history.messages = TEST_MESSAGES.copy()
+
+    chat_history.save("test.json")
+
+    saved_file = tmp_path / "missing" / "chats" / "test.json"
+    with open(saved_file) as f:
+        assert json.load(f) == chat_history.messages
+
+
+def test_chat_history_save_failure_keeps_existing_file(chat_history, tmp_path):
+    chat_history.config.chat_dir = str(tmp_path)
+    chat_history.messages = TEST_MESSAGES.copy()
+    chat_history.save("test.json")
+
+    chat_history.messages.append({"role": "user", "content": object()})
+    with pytest.raises(TypeError):
+        chat_history.save("test.json")
+
+    with open(tmp_path / "test.json") as f:
+        assert json.load(f) == TEST_MESSAGES
+
+
 def test_chat_history_load(chat_history):
-    test_messages = [
-        {"role": "system", "content": "test system"},
-        {"role": "user", "content": "test user"}
-    ]
-    mock_file = mock_open(read_data=json.dumps(test_messages))
+    mock_file = mock_open(read_data=TEST_MESSAGES_JSON)
 
     with patch("builtins.open", mock_file):
         chat_history.load("test.json")
 
-    assert chat_history.messages == test_messages
+    assert chat_history.messages == TEST_MESSAGES
 
 
-def test_chat_history_load_file_not_found(chat_history):
+def test_chat_history_load_file_not_found(chat_history, tmp_path):
+    chat_history.config.chat_dir = str(tmp_path)
     with pytest.raises(FileNotFoundError):
         chat_history.load("nonexistent.json")
 
@@ -89,80 +144,73 @@ def test_chat_history_append_from_file(chat_history):
         {"role": "system", "content": "system1"},
         {"role": "user", "content": "user1"}
     ]
-    append_messages = [
-        {"role": "system", "content": "system2"},
-        {"role": "user", "content": "user2"},
-        {"role": "assistant", "content": "assistant2"}
-    ]
     chat_history.messages = original_messages.copy()
 
-    mock_file = mock_open(read_data=json.dumps(append_messages))
+    mock_file = mock_open(read_data=APPENDED_MESSAGES_JSON)
     with patch("builtins.open", mock_file):
         chat_history.append_from_file("append.json")
 
     # Check that system message was filtered out and other messages were appended
     expected_messages = original_messages + [
-        msg for msg in append_messages if msg["role"] != "system"
+        msg for msg in APPENDED_MESSAGES if msg["role"] != "system"
     ]
     assert chat_history.messages == expected_messages
 
 
 # Test LLMClient
-@patch("openai.OpenAI")
-@patch("anthropic.Anthropic")
-def test_llm_client_init(mock_anthropic, mock_openai):
-    client = LLMClient(Config())
-    assert client.openai is not None
-    assert client.anthropic is not None
+def test_llm_client_init(config):
+    # Stub the SDK modules so the test doesn't pay for importing them
+    mock_openai, mock_anthropic = Mock(), Mock()
+    with patch.dict(
+        "sys.modules", {"openai": mock_openai, "anthropic": mock_anthropic}
+    ):
+        client = LLMClient(config)
+    assert client.openai is mock_openai.OpenAI.return_value
+    assert client.anthropic is mock_anthropic.Anthropic.return_value
 
 
 # Test InputHandler
-def test_parse_command_valid():
-    handler = InputHandler()
-    command, args = handler.parse_command("%save test.json")
-    assert command == "save"
-    assert args == "test.json"
-
-
-def test_parse_command_invalid():
-    handler = InputHandler()
+@pytest.mark.parametrize(
+    "input_str, expected",
+    [
+        ("%save test.json", ("save", "test.json")),
+        ("%load old chat.json", ("load", "old chat.json")),
+        ("%save", ("save", None)),
+        ("regular input", (None, None)),
+    ],
+    ids=["valid", "args_with_spaces", "no_args", "not_command"],
+)
+def test_parse_command(input_handler, input_str, expected):
+    assert input_handler.parse_command(input_str) == expected
+
+
+def test_parse_command_invalid(input_handler):
     with pytest.raises(ValueError):
-        handler.parse_command("%invalid test")
+        input_handler.parse_command("%invalid test")
 
 
-def test_parse_command_no_args():
-    handler = InputHandler()
-    command, args = handler.parse_command("%save")
-    assert command == "save"
-    assert args is None
-
-
-def test_parse_not_command():
-    handler = InputHandler()
-    command, args = handler.parse_command("regular input")
-    assert command is None
-    assert args is None
+# Integration-style tests
+@pytest.fixture
+def fake_input(monkeypatch):
+    # Plain stand-in for builtins.input that replays the given lines
+    def feed(*lines):
+        remaining = iter(lines)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(remaining))
+    return feed
 
 
-# Integration-style tests
-@patch("builtins.input")
-@patch("builtins.print")
-def test_input_handler_single_line(mock_print, mock_input):
-    mock_input.return_value = "test input"
-    handler = InputHandler()
-    result = handler.get_user_input()
+def test_input_handler_single_line(input_handler, fake_input):
+    fake_input("test input")
+    result = input_handler.get_user_input()
     assert result == "test input"
 
 
-@patch("builtins.input")
-@patch("builtins.print")
-def test_input_handler_multi_line(mock_print, mock_input):
-    mock_input.side_effect = [
+def test_input_handler_multi_line(input_handler, fake_input):
+    fake_input(
         ">start",
         "line 1",
         "line 2",
         ">>"
-    ]
-    handler = InputHandler()
-    result = handler.get_user_input()
+    )
+    result = input_handler.get_user_input()
     assert result == "line 1\nline 2"
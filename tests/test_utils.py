@@ -0,0 +1,80 @@
+import os
+import pytest
+from importlib import resources
+
+from llm_cli import utils
+from llm_cli.utils import read_system_message_from_file, get_prompts
+
+
+def _touch_later(path):
+    # Bump the mtime explicitly so coarse filesystem timestamps can't
+    # leave the cache key unchanged
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _package_prompt(file_name):
+    with resources.files('llm_cli.prompts').joinpath(file_name).open('r') as file:
+        return file.read()
+
+
+# Fixtures
+@pytest.fixture
+def prompts_dir(tmp_path, monkeypatch):
+    utils._get_user_prompts_dir.cache_clear()
+    utils._read_system_message.cache_clear()
+    utils._get_prompts.cache_clear()
+    monkeypatch.setattr(utils, "_get_user_prompts_dir", lambda: tmp_path)
+    yield tmp_path
+    utils._read_system_message.cache_clear()
+    utils._get_prompts.cache_clear()
+
+
+# Test read_system_message_from_file
+def test_read_falls_back_to_package_prompt(prompts_dir):
+    assert (
+        read_system_message_from_file("prompt_general.txt")
+        == _package_prompt("prompt_general.txt")
+    )
+
+
+def test_read_picks_up_edited_override(prompts_dir):
+    override = prompts_dir / "prompt_general.txt"
+    override.write_text("first")
+    assert read_system_message_from_file("prompt_general.txt") == "first"
+
+    override.write_text("second")
+    _touch_later(override)
+    assert read_system_message_from_file("prompt_general.txt") == "second"
+
+
+def test_read_falls_back_after_override_deleted(prompts_dir):
+    override = prompts_dir / "prompt_general.txt"
+    override.write_text("override")
+    assert read_system_message_from_file("prompt_general.txt") == "override"
+
+    override.unlink()
+    assert (
+        read_system_message_from_file("prompt_general.txt")
+        == _package_prompt("prompt_general.txt")
+    )
+
+
+def test_read_missing_prompt(prompts_dir):
+    with pytest.raises(FileNotFoundError):
+        read_system_message_from_file("prompt_missing.txt")
+
+
+# Test get_prompts
+def test_get_prompts_picks_up_new_prompt(prompts_dir):
+    assert "x" not in get_prompts()
+
+    (prompts_dir / "prompt_x.txt").write_text("")
+    _touch_later(prompts_dir)
+    assert get_prompts() == ["concise", "general", "x"]
+
+
+def test_get_prompts_skips_non_prompt_files(prompts_dir):
+    for file_name in ["prompt_foo.txt.bak", "prompt_.txt", "notes.txt"]:
+        (prompts_dir / file_name).write_text("")
+    assert get_prompts() == ["concise", "general"]